@@ -11,11 +11,14 @@ try:
 except ImportError:
     import importlib_metadata as metadata
 
-import itertools
-import multiprocessing
-from packaging.requirements import Requirement
+from concurrent.futures import ThreadPoolExecutor, wait
+import functools
+import os
+from packaging.requirements import InvalidRequirement, Requirement
 from packaging.version import Version
-from textwrap import dedent
+import string
+from textwrap import indent
+import time
 import traceback
 
 import fiftyone as fo
@@ -25,7 +28,29 @@ import fiftyone.operators as foo
 import fiftyone.operators.types as types
 import fiftyone.plugins as fop
 
-from .utils import find_plugins, get_zoo_plugins, get_plugin_info
+from .utils import (
+    clear_cache,
+    clear_plugins_cache,
+    find_plugins,
+    flush_cache,
+    get_zoo_plugins,
+    get_zoo_plugin_url,
+    get_plugin_info,
+    get_plugin_infos,
+    is_rate_limit_error,
+    list_enabled_plugins,
+    list_plugin_names,
+    list_plugin_summaries,
+    list_plugins,
+)
+
+
+# Plugin metadata fetches are I/O-bound, so they share a persistent pool
+_FETCH_POOL = ThreadPoolExecutor(
+    max_workers=min(16, (os.cpu_count() or 4) * 4),
+    thread_name_prefix="plugin-meta",
+)
+_FETCH_TIMEOUT = 30
 
 
 class InstallPlugin(foo.Operator):
@@ -46,6 +71,8 @@ class InstallPlugin(foo.Operator):
 
     def execute(self, ctx):
         _install_plugin(ctx)
+        clear_cache()
+        clear_plugins_cache()
 
 
 def _install_plugin_inputs(ctx, inputs):
@@ -88,7 +115,11 @@ Provide a location to download the plugin(s) from, which can be:
 
         try:
             plugins = find_plugins(gh_repo)
-        except:
+        except Exception as e:
+            if is_rate_limit_error(e):
+                _rate_limit_warning(inputs)
+                return
+
             prop = inputs.view(
                 "error",
                 types.Error(
@@ -108,13 +139,9 @@ Provide a location to download the plugin(s) from, which can be:
             return
 
         if len(plugins) > 1:
-            plugin_choices = types.Dropdown(multiple=True)
-            for plugin in plugins:
-                plugin_choices.add_choice(
-                    plugin["name"],
-                    label=plugin["name"],
-                    description=plugin["description"],
-                )
+            plugin_choices = types.Dropdown(
+                multiple=True, choices=_make_plugin_choices(plugins)
+            )
 
             inputs.list(
                 "plugin_names",
@@ -134,7 +161,11 @@ Provide a location to download the plugin(s) from, which can be:
     else:
         try:
             voxel51_plugins, community_plugins = get_zoo_plugins()
-        except:
+        except Exception as e:
+            if is_rate_limit_error(e):
+                _rate_limit_warning(inputs)
+                return
+
             prop = inputs.view(
                 "error",
                 types.Error(
@@ -158,13 +189,9 @@ Provide a location to download the plugin(s) from, which can be:
                 "Choose a community-authored plugin from the zoo to install"
             )
 
-        plugin_choices = types.AutocompleteView()
-        for plugin in plugins:
-            plugin_choices.add_choice(
-                plugin["name"],
-                label=plugin["name"],
-                description=plugin["description"],
-            )
+        plugin_choices = types.AutocompleteView(
+            choices=_make_plugin_choices(plugins)
+        )
 
         inputs.enum(
             param,
@@ -182,7 +209,15 @@ Provide a location to download the plugin(s) from, which can be:
     if plugin_names is None:
         return
 
-    updates = _get_updates(plugin_names, plugins)
+    try:
+        updates = _get_updates(plugin_names, plugins)
+    except Exception as e:
+        if not is_rate_limit_error(e):
+            raise
+
+        # Installing doesn't depend on the update check, so it isn't blocked
+        _rate_limit_warning(inputs, invalid=False)
+        return
 
     if updates:
         # @todo why is a unique prop name required for Markdown to re-render?
@@ -191,7 +226,8 @@ Provide a location to download the plugin(s) from, which can be:
             "You are about to update the following plugins:\n"
             + "\n".join(
                 [
-                    f"- `{name}`: `v{curr_ver}` -> `v{ver}`"
+                    f"- `{name}`: `v{curr_ver}` -> "
+                    + (f"`v{ver}`" if ver else "unknown version")
                     for (name, curr_ver, ver) in updates
                 ]
             )
@@ -206,21 +242,51 @@ Provide a location to download the plugin(s) from, which can be:
         inputs.view("update_notice", types.Notice(label=update_notice))
 
 
+def _rate_limit_warning(inputs, invalid=True):
+    prop = inputs.view(
+        "warning",
+        types.Warning(
+            label="GitHub API rate limit exceeded",
+            description=(
+                "Please try again later. You can increase your rate limit by "
+                "setting a GITHUB_TOKEN environment variable"
+            ),
+        ),
+    )
+    prop.invalid = invalid
+
+
+def _make_plugin_choices(plugins):
+    return [
+        types.Choice(
+            plugin["name"],
+            label=plugin["name"],
+            description=plugin["description"],
+        )
+        for plugin in plugins
+    ]
+
+
 def _get_updates(plugin_names, plugins):
-    curr_plugins_map = {p.name: p for p in fop.list_plugins(enabled="all")}
-    update_names = sorted(set(plugin_names) & set(curr_plugins_map.keys()))
+    curr_plugins_map = {p.name: p for p in list_plugins()}
+    plugin_names = set(plugin_names)
 
-    if not update_names:
+    plugins_map = {
+        p["name"]: p
+        for p in plugins
+        if p["name"] in plugin_names and p["name"] in curr_plugins_map
+    }
+
+    if not plugins_map:
         return []
 
-    plugins_map = {p["name"]: p for p in plugins if p["name"] in update_names}
     _hydrate_plugin_info(plugins_map)
 
     updates = []
-    for name in update_names:
+    for name in sorted(plugins_map.keys()):
         curr_plugin = curr_plugins_map[name]
         plugin = plugins_map[name]
-        updates.append((name, curr_plugin.version, plugin["version"]))
+        updates.append((name, curr_plugin.version, plugin.get("version")))
 
     return updates
 
@@ -231,6 +297,14 @@ def _hydrate_plugin_info(plugins_map):
         if "version" not in plugin:
             tasks[name] = plugin["url"]
 
+    if len(tasks) > 1:
+        infos = get_plugin_infos(tasks.values())
+        for name, url in list(tasks.items()):
+            info = infos.get(url, None)
+            if info is not None:
+                plugins_map[name] = info
+                del tasks[name]
+
     num_tasks = len(tasks)
 
     if num_tasks == 0:
@@ -238,20 +312,40 @@ def _hydrate_plugin_info(plugins_map):
 
     if num_tasks == 1:
         name, url = next(iter(tasks.items()))
-        info = get_plugin_info(url)
-        plugins_map[name] = info
+        try:
+            plugins_map[name] = get_plugin_info(url)
+        except Exception as e:
+            if is_rate_limit_error(e):
+                raise
+        finally:
+            flush_cache()
+
+        return
+
+    futures = {
+        _FETCH_POOL.submit(get_plugin_info, url): name
+        for name, url in tasks.items()
+    }
+
+    # Plugins whose info can't be retrieved in time are left as-is, and
+    # fetches that haven't started yet are cancelled so that they don't tie
+    # up the pool for later renders
+    done, not_done = wait(futures, timeout=_FETCH_TIMEOUT)
+    for future in not_done:
+        future.cancel()
 
-    processes = min(num_tasks, 4)
-    tasks = list(tasks.items())
-    with multiprocessing.dummy.Pool(processes=processes) as pool:
-        for name, info in pool.imap_unordered(_do_get_plugin_info, tasks):
-            plugins_map[name] = info
+    rate_limit_error = None
+    for future in done:
+        e = future.exception()
+        if e is None:
+            plugins_map[futures[future]] = future.result()
+        elif is_rate_limit_error(e):
+            rate_limit_error = e
 
+    flush_cache()
 
-def _do_get_plugin_info(task):
-    name, url = task
-    info = get_plugin_info(url)
-    return name, info
+    if rate_limit_error is not None:
+        raise rate_limit_error
 
 
 def _install_plugin(ctx):
@@ -262,22 +356,18 @@ def _install_plugin(ctx):
         plugin_names = ctx.params.get("plugin_names", None)
     elif tab == "VOXEL51":
         plugin_name = ctx.params["voxel51_plugin"]
-        gh_repo = _get_zoo_plugin_location(plugin_name)
+        gh_repo = get_zoo_plugin_url(plugin_name)
         plugin_names = [plugin_name]
     elif tab == "COMMUNITY":
         plugin_name = ctx.params["community_plugin"]
-        gh_repo = _get_zoo_plugin_location(plugin_name)
+        gh_repo = get_zoo_plugin_url(plugin_name)
         plugin_names = [plugin_name]
 
+    # A single call downloads the repository once and extracts all requested
+    # plugins from it; per-plugin downloads would refetch the same archive
     fop.download_plugin(gh_repo, plugin_names=plugin_names, overwrite=True)
 
 
-def _get_zoo_plugin_location(plugin_name):
-    for plugin in itertools.chain(*get_zoo_plugins()):
-        if plugin["name"] == plugin_name:
-            return plugin["url"]
-
-
 class ManagePlugins(foo.Operator):
     @property
     def config(self):
@@ -339,12 +429,12 @@ def _plugin_enablement_inputs(ctx, inputs):
     )
     inputs.define_property("enablement_header", obj)
 
-    enabled_plugins = set(fop.list_enabled_plugins())
+    enabled_plugins = list_enabled_plugins()
 
     num_edited = 0
-    for i, plugin in enumerate(fop.list_plugins(enabled="all"), 1):
+    for i, (name, url, description) in enumerate(list_plugin_summaries(), 1):
         prop_name = f"enablement{i}"
-        actual_enabled = plugin.name in enabled_plugins
+        actual_enabled = name in enabled_plugins
         enabled = ctx.params.get(prop_name, {}).get("enabled", actual_enabled)
         edited = enabled != actual_enabled
         num_edited += int(edited)
@@ -352,17 +442,17 @@ def _plugin_enablement_inputs(ctx, inputs):
         obj = types.Object()
         obj.str(
             "markdown_name",
-            default=f"[{plugin.name}]({plugin.url})",
+            default=f"[{name}]({url})",
             view=types.MarkdownView(read_only=True, space=3),
         )
         obj.str(
             "description",
-            default=plugin.description,
+            default=description,
             view=types.MarkdownView(read_only=True, space=6.5),
         )
         obj.str(
             "name",
-            default=plugin.name,
+            default=name,
             view=types.HiddenView(read_only=True, space=0.5),
         )
         obj.bool(
@@ -390,32 +480,45 @@ def _plugin_enablement_inputs(ctx, inputs):
 
 
 def _plugin_enablement(ctx):
-    enabled_plugins = set(fop.list_enabled_plugins())
-
-    i = 0
-    while True:
-        i += 1
-        prop_name = f"enablement{i}"
-        obj = ctx.params.get(prop_name, None)
-        if obj is None:
-            break
+    enabled_plugins = list_enabled_plugins()
 
+    to_enable = []
+    to_disable = []
+    for obj in _get_enablement_params(ctx):
         name = obj["name"]
         enabled = obj["enabled"]
 
         actual_enabled = name in enabled_plugins
-        if enabled != actual_enabled:
-            if enabled:
-                fop.enable_plugin(name)
-            else:
-                fop.disable_plugin(name)
+        if enabled and not actual_enabled:
+            to_enable.append(name)
+        elif actual_enabled and not enabled:
+            to_disable.append(name)
+
+    for name in to_enable:
+        fop.enable_plugin(name)
+
+    for name in to_disable:
+        fop.disable_plugin(name)
+
+
+def _get_enablement_params(ctx):
+    prefix = "enablement"
+
+    params = {}
+    for key, obj in ctx.params.items():
+        idx = key[len(prefix) :]
+        if key.startswith(prefix) and idx.isdigit() and obj is not None:
+            params[int(idx)] = obj
+
+    return [params[idx] for idx in sorted(params)]
 
 
 def _plugin_requirements_inputs(ctx, inputs):
-    plugin_names = [p.name for p in fop.list_plugins(enabled="all")]
-    plugin_choices = types.Dropdown()
-    for name in sorted(plugin_names):
-        plugin_choices.add_choice(name, label=name)
+    plugin_choices = types.Dropdown(
+        choices=[
+            types.Choice(name, label=name) for name in list_plugin_names()
+        ]
+    )
 
     inputs.enum(
         "requirements_name",
@@ -511,7 +614,7 @@ def _check_fiftyone_requirement(req_str):
     version = foc.VERSION
 
     try:
-        req = Requirement(req_str)
+        req = _parse_requirement(req_str)
         satisfied = not req.specifier or req.specifier.contains(version)
     except:
         satisfied = False
@@ -521,14 +624,11 @@ def _check_fiftyone_requirement(req_str):
 
 def _check_package_requirement(req_str):
     try:
-        req = Requirement(req_str)
-    except:
-        pass
+        req = _parse_requirement(req_str)
+    except InvalidRequirement:
+        return req_str, None, False
 
-    try:
-        version = metadata.version(req.name)
-    except:
-        version = None
+    version = _get_package_version(req.name)
 
     try:
         satisfied = (version is not None) and (
@@ -540,6 +640,37 @@ def _check_package_requirement(req_str):
     return req_str, version, satisfied
 
 
+@functools.lru_cache(maxsize=1024)
+def _parse_requirement(req_str):
+    return Requirement(req_str)
+
+
+# Installed package versions are re-checked this often (in seconds), so that
+# packages installed while the App is running are picked up
+_PACKAGE_VERSION_TTL = 10
+
+
+def _get_package_version(name):
+    ttl_hash = int(time.time() // _PACKAGE_VERSION_TTL)
+    return _get_package_version_cached(name, ttl_hash)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_package_version_cached(name, ttl_hash):
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def _make_radio_group(choices):
+    radio_group = types.RadioGroup()
+    for choice in choices:
+        radio_group.add_choice(choice, label=choice)
+
+    return radio_group
+
+
 class BuildPluginComponent(foo.Operator):
     @property
     def config(self):
@@ -558,8 +689,7 @@ class BuildPluginComponent(foo.Operator):
         view_type = ctx.params.get("view_type", None)
 
         if view_type is not None:
-            view_options = VIEW_TYPE_TO_OPTIONS[view_type]
-            _create_options_input(inputs, view_options, view_type)
+            _create_options_input(inputs, view_type)
             _create_view_code(ctx, inputs, view_type)
 
         view = types.View(label="Build plugin component")
@@ -602,26 +732,28 @@ VIEW_TYPE_TO_OPTIONS = {
 }
 
 
-def _create_view_type_input(inputs):
-    radio_group = types.RadioGroup()
-    for key in sorted(VIEW_TYPE_TO_OPTIONS.keys()):
-        radio_group.add_choice(key, label=key)
+VIEW_TYPE_RADIO_GROUP = _make_radio_group(sorted(VIEW_TYPE_TO_OPTIONS.keys()))
+
+VIEW_OPTIONS_RADIO_GROUPS = {
+    view_type: _make_radio_group([key.capitalize() for key in options])
+    for view_type, options in VIEW_TYPE_TO_OPTIONS.items()
+}
 
+
+def _create_view_type_input(inputs):
     inputs.enum(
         "view_type",
-        radio_group.values(),
+        VIEW_TYPE_RADIO_GROUP.values(),
         label="Component type",
         description="Select a type of component to create",
         required=True,
-        default=radio_group.choices[0].value,
+        default=VIEW_TYPE_RADIO_GROUP.choices[0].value,
         view=types.RadioView(),
     )
 
 
-def _create_options_input(inputs, options_dict, view_type):
-    oi_radio_group = types.RadioGroup()
-    for key, _ in options_dict.items():
-        oi_radio_group.add_choice(key.capitalize(), label=key.capitalize())
+def _create_options_input(inputs, view_type):
+    oi_radio_group = VIEW_OPTIONS_RADIO_GROUPS[view_type]
 
     if view_type == "Boolean":
         inputs.str(
@@ -708,6 +840,18 @@ def _create_view_code(ctx, inputs, view_type):
         _create_radio_group_code(ctx, inputs)
 
 
+BOOLEAN_CODE_TEMPLATE = string.Template(
+    """
+inputs.bool(
+    "my_boolean",
+    label="My boolean label",
+    description="My boolean description",
+    view=${view_text}(),${default_code}
+)
+"""
+)
+
+
 def _create_boolean_code(ctx, inputs):
     view_type = ctx.params.get("boolean_view_type", "Checkbox")
     view_text, view_realization = BOOLEAN_VIEW_OPTIONS[view_type]
@@ -724,22 +868,18 @@ def _create_boolean_code(ctx, inputs):
     has_default = ctx.params.get("boolean_view_has_default", False)
     if has_default:
         default = ctx.params.get("boolean_view_default", None)
-        default_code = f"\n    default={default}"
+        default_code = f"\n    default={default},"
     else:
         default = None
         default_code = ""
 
-    code = f"""
-    inputs.bool(
-        "my_boolean",
-        label="My boolean label",
-        description="My boolean description",
-        view={view_text}(),{default_code}
-    )"""
+    code = BOOLEAN_CODE_TEMPLATE.substitute(
+        view_text=view_text, default_code=default_code
+    )
 
     inputs.str(
         f"boolean_code_{view_type}",
-        default=_dedent_code(code),
+        default=code.strip(),
         view=types.CodeView(language="python"),
     )
 
@@ -790,6 +930,18 @@ def _create_float_props(inputs):
     inputs.define_property("float_props", obj)
 
 
+FLOAT_CODE_TEMPLATE = string.Template(
+    """
+inputs.float(
+    "my_float",
+    label="My float label",
+    description="My float description",
+    view=${view_text}(${component_props_code}),${default_code}
+)
+"""
+)
+
+
 def _create_float_code(ctx, inputs):
     view_type = ctx.params.get("float_view_type", "Slider")
     view_text, view_realization = FLOAT_VIEW_OPTIONS[view_type]
@@ -826,26 +978,22 @@ def _create_float_code(ctx, inputs):
         ),
     )
 
-    default_code = f"\n    default={default}" if default is not None else ""
+    default_code = f"\n    default={default}," if default is not None else ""
 
     if len(componentsPropsDict) == 0:
         component_props_code = ""
     else:
-        component_props_code = "componentsProps=" + str(componentProps).replace(
-            "{", "{"
-        ).replace("}", "}")
+        component_props_code = "componentsProps=" + str(componentProps)
 
-    code = f"""
-    inputs.float(
-        "my_float",
-        label="My float label",
-        description="My float description",
-        view={view_text}({component_props_code}),{default_code}
-    )"""
+    code = FLOAT_CODE_TEMPLATE.substitute(
+        view_text=view_text,
+        component_props_code=component_props_code,
+        default_code=default_code,
+    )
 
     inputs.str(
         f"float_code_{view_type}_{min}_{max}_{step}_{default}",
-        default=_dedent_code(code),
+        default=code.strip(),
         view=types.CodeView(language="python"),
     )
 
@@ -867,6 +1015,51 @@ def _create_float_code(ctx, inputs):
     )
 
 
+MESSAGE_CODE_TEMPLATES = {
+    "Message": string.Template(
+        """
+inputs.message(
+    "message",
+    label="${label}",
+    description="${description}"
+)
+"""
+    ),
+    "Success": string.Template(
+        """
+inputs.view(
+    "success",
+    types.Success(label="${label}", description="${description}")
+)
+"""
+    ),
+    "Warning": string.Template(
+        """
+inputs.view(
+    "warning",
+    types.Warning(label="${label}", description="${description}")
+)
+"""
+    ),
+    "Error": string.Template(
+        """
+inputs.view(
+    "error",
+    types.Error(label="${label}", description="${description}")
+)
+"""
+    ),
+    "Header": string.Template(
+        """
+inputs.view(
+    "header",
+    types.Header(label="${label}", description="${description}", divider=True)
+)
+"""
+    ),
+}
+
+
 def _create_message_code(ctx, inputs):
     view_type = ctx.params.get("message_view_type", "Message")
 
@@ -893,43 +1086,15 @@ def _create_message_code(ctx, inputs):
     label = ctx.params.get("message_label", "Message Label")
     description = ctx.params.get("message_description", "Message Description")
 
-    if view_type == "Message":
-        code = f"""
-        inputs.message(
-            "message", 
-            label="{label}", 
-            description="{description}"
-        )"""
-    elif view_type == "Success":
-        code = f"""
-        inputs.view(
-            "success", 
-            types.Success(label="{label}", description="{description}")
-        )"""
-    elif view_type == "Warning":
-        code = f"""
-        inputs.view(
-            "warning", 
-            types.Warning(label="{label}", description="{description}")
-        )"""
-    elif view_type == "Error":
-        code = f"""
-        inputs.view(
-            "error", 
-            types.Error(label="{label}", description="{description}")
-        )"""
-    elif view_type == "Header":
-        code = f"""
-        inputs.view(
-            "header", 
-            types.Header(label="{label}", description="{description}", divider=True)
-        )"""
-    else:
+    code_template = MESSAGE_CODE_TEMPLATES.get(view_type, None)
+    if code_template is None:
         raise ValueError("Invalid view type")
 
+    code = code_template.substitute(label=label, description=description)
+
     inputs.str(
         f"message_code_{view_type}_{label}_{description}",
-        default=_dedent_code(code),
+        default=code.strip(),
         view=types.CodeView(language="python"),
     )
 
@@ -985,6 +1150,31 @@ def _create_radio_props(inputs):
     inputs.define_property("radio_props", obj)
 
 
+RADIO_GROUP_CODE_TEMPLATE = string.Template(
+    """
+my_choices = ["aaa", "abc", "ace"] # replace with your choices
+
+my_radio_group = types.RadioGroup()
+
+for choice in my_choices:
+    my_radio_group.add_choice(choice, label=choice)
+
+inputs.enum(
+    "my_radio_group",
+    my_radio_group.values(),
+    label="My radio group label",
+    description="My radio group description",
+    view=${view_text}(),
+${default_code}    required=${required},
+)
+"""
+)
+
+RADIO_GROUP_PREVIEW_CHOICES = ("aaa", "abc", "ace")
+
+RADIO_GROUP_PREVIEW = _make_radio_group(RADIO_GROUP_PREVIEW_CHOICES)
+
+
 def _create_radio_group_code(ctx, inputs):
     view_type = ctx.params.get("radio_view_type", "Dropdown")
 
@@ -995,8 +1185,8 @@ def _create_radio_group_code(ctx, inputs):
     required = rbp.get("required", False)
 
     if has_default:
-        default = "aaa"
-        default_code = f"    default='{default}',\n    "
+        default = RADIO_GROUP_PREVIEW_CHOICES[0]
+        default_code = f"    default='{default}',\n"
     else:
         default = None
         default_code = ""
@@ -1010,26 +1200,13 @@ def _create_radio_group_code(ctx, inputs):
         ),
     )
 
-    code = f"""
-    my_choices = ["aaa", "abc", "ace"] # replace with your choices
-
-    my_radio_group = types.RadioGroup()
-
-    for choice in my_choices:
-        my_radio_group.add_choice(choice, label=choice)
-
-    inputs.enum(
-        "my_radio_group",
-        my_radio_group.values(),
-        label="My radio group label",
-        description="My radio group description",
-        view={view_text}(),
-    {default_code}    required={required},
-    )"""
+    code = RADIO_GROUP_CODE_TEMPLATE.substitute(
+        view_text=view_text, default_code=default_code, required=required
+    )
 
     inputs.str(
         f"radio_group_code_{view_type}_{has_default}_{default}_{required}",
-        default=_dedent_code(code),
+        default=code.strip(),
         view=types.CodeView(language="python"),
     )
 
@@ -1042,13 +1219,9 @@ def _create_radio_group_code(ctx, inputs):
         ),
     )
 
-    radio_group_preview = types.RadioGroup()
-    for choice in ["aaa", "abc", "ace"]:
-        radio_group_preview.add_choice(choice, label=choice)
-
     inputs.enum(
         f"radio_group_preview_{default}",
-        radio_group_preview.values(),
+        RADIO_GROUP_PREVIEW.values(),
         label="My radio group label",
         description="My radio group description",
         view=view_realization(),
@@ -1093,10 +1266,12 @@ class BuildOperatorSkeleton(foo.Operator):
     def execute(self, ctx):
         plugin_dir = _parse_plugin_dir(ctx)
 
+        fos.ensure_dir(plugin_dir)
+
         # Create __init__.py
-        init = _create_operator_skeleton_code(ctx)
         init_path = fos.join(plugin_dir, "__init__.py")
-        fos.write_file(init, init_path)
+        with fos.open_file(init_path, "w") as f:
+            f.writelines(_create_operator_skeleton_code_parts(ctx))
 
         # Create fiftyone.yml
         yml = _create_fiftyone_yml_code(ctx)
@@ -1113,14 +1288,13 @@ OPERATOR_SKELETON_TABS = (
 )
 
 
-def _operator_skeleton_tabs_input(inputs):
-    os_group = types.RadioGroup()
-    for tab in OPERATOR_SKELETON_TABS:
-        os_group.add_choice(tab, label=tab)
+OPERATOR_SKELETON_TABS_GROUP = _make_radio_group(OPERATOR_SKELETON_TABS)
+
 
+def _operator_skeleton_tabs_input(inputs):
     inputs.enum(
         "operator_skeleton_tab",
-        os_group.values(),
+        OPERATOR_SKELETON_TABS_GROUP.values(),
         label="Skeleton creation",
         description="Walk through the steps to create an operator skeleton",
         view=types.TabsView(),
@@ -1207,58 +1381,82 @@ def _operator_skeleton_config_flow(ctx, inputs):
     inputs.define_property("config_icon_props", icon_obj)
 
 
-def _create_operator_config_code(ctx):
-    operator_name = ctx.params.get("operator_name", "my_operator")
-    operator_label = ctx.params.get("operator_label", "My operator")
-    operator_description = ctx.params.get(
+OPERATOR_CONFIG_CODE_TEMPLATE = string.Template(
+    """
+@property
+def config(self):
+    return foo.OperatorConfig(
+        name="${operator_name}",
+        label="${operator_label}",
+        description="${operator_description}",${options}
+    )
+"""
+)
+
+ICON_OPTION_LINES = (
+    'icon="/path/to/icon.svg",',
+    'light_icon="/path/to/light_icon.svg",',
+    'dark_icon="/path/to/dark_icon.svg",',
+)
+
+# Icon option lines for each (icon, light_icon, dark_icon) combination
+ICON_OPTIONS = {
+    flags: tuple(
+        option for option, enabled in zip(ICON_OPTION_LINES, flags) if enabled
+    )
+    for flags in (
+        (icon, light_icon, dark_icon)
+        for icon in (False, True)
+        for light_icon in (False, True)
+        for dark_icon in (False, True)
+    )
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _create_operator_config_code(key):
+    params = _thaw_params(key)
+
+    operator_name = params.get("operator_name", "my_operator")
+    operator_label = params.get("operator_label", "My operator")
+    operator_description = params.get(
         "operator_description", "My operator description"
     )
 
-    config_bool_props = ctx.params.get("config_bool_props", {})
+    config_bool_props = params.get("config_bool_props", {})
     dynamic = config_bool_props.get("operator_dynamic", False)
     execute_as_generator = config_bool_props.get("execute_as_generator", False)
     unlisted = config_bool_props.get("unlisted", False)
     on_startup = config_bool_props.get("on_startup", False)
 
-    config_icon_props = ctx.params.get("config_icon_props", {})
+    config_icon_props = params.get("config_icon_props", {})
     config_icon = config_icon_props.get("config_icon", True)
     config_light_icon = config_icon_props.get("config_light_icon", False)
     config_dark_icon = config_icon_props.get("config_dark_icon", False)
 
-    code = f"""
-    @property
-    def config(self):
-        return foo.OperatorConfig(
-            name="{operator_name}",
-            label="{operator_label}",
-            description="{operator_description}","""
-
+    options = []
     if dynamic:
-        code += f"""
-            dynamic={dynamic},"""
+        options.append(f"dynamic={dynamic},")
     if execute_as_generator:
-        code += f"""
-            execute_as_generator={execute_as_generator},"""
+        options.append(f"execute_as_generator={execute_as_generator},")
     if unlisted:
-        code += f"""
-            unlisted={unlisted},"""
+        options.append(f"unlisted={unlisted},")
     if on_startup:
-        code += f"""
-            on_startup={on_startup},"""
-    if config_icon:
-        code += f"""
-            icon="/path/to/icon.svg","""
-    if config_light_icon:
-        code += f"""
-            light_icon="/path/to/light_icon.svg","""
-    if config_dark_icon:
-        code += f"""
-            dark_icon="/path/to/dark_icon.svg","""
+        options.append(f"on_startup={on_startup},")
+    options.extend(
+        ICON_OPTIONS[
+            bool(config_icon), bool(config_light_icon), bool(config_dark_icon)
+        ]
+    )
 
-    code += f"""
-        )"""
+    code = OPERATOR_CONFIG_CODE_TEMPLATE.substitute(
+        operator_name=operator_name,
+        operator_label=operator_label,
+        operator_description=operator_description,
+        options="".join("\n        " + option for option in options),
+    )
 
-    return _dedent_code(code)
+    return code.strip()
 
 
 def _operator_skeleton_io_flow(ctx, inputs):
@@ -1277,45 +1475,50 @@ def _operator_skeleton_io_flow(ctx, inputs):
     )
 
 
-def _operator_skeleton_input_code(ctx):
-    has_input = ctx.params.get("operator_input_has_input", False)
-    delegation = ctx.params.get("delegated_execution_choices", "False")
-    deleg_user_choice = delegation == "User Choice"
+RESOLVE_INPUT_CODE = """
+def resolve_input(self, ctx):
+    inputs = types.Object()
 
-    if has_input and not deleg_user_choice:
-        code = """
-        def resolve_input(self, ctx):
-            inputs = types.Object()
+    ### Add your inputs here ###
 
-            ### Add your inputs here ###
+    return types.Property(inputs)
+""".strip()
 
-            return types.Property(inputs)
-        """
-    elif has_input and deleg_user_choice:
-        code = """
-        def resolve_input(self, ctx):
-            inputs = types.Object()
+RESOLVE_INPUT_EXECUTION_MODE_CODE = """
+def resolve_input(self, ctx):
+    inputs = types.Object()
 
-            ### Add your inputs here ###
+    ### Add your inputs here ###
 
-            _execution_mode(ctx, inputs)
-            return types.Property(inputs)
-        """
-    elif deleg_user_choice:
-        code = """
-        def resolve_input(self, ctx):
-            inputs = types.Object()
+    _execution_mode(ctx, inputs)
+    return types.Property(inputs)
+""".strip()
 
-            _execution_mode(ctx, inputs)
-            return types.Property(inputs)
-        """
-    else:
-        code = """
-        def resolve_input(self, ctx):
-            pass
-        """
+RESOLVE_EXECUTION_MODE_CODE = """
+def resolve_input(self, ctx):
+    inputs = types.Object()
+
+    _execution_mode(ctx, inputs)
+    return types.Property(inputs)
+""".strip()
 
-    return _dedent_code(code)
+NO_INPUT_CODE = """
+def resolve_input(self, ctx):
+    pass
+""".strip()
+
+
+def _operator_skeleton_input_code(has_input, user_choice):
+    if has_input and not user_choice:
+        return RESOLVE_INPUT_CODE
+
+    if has_input and user_choice:
+        return RESOLVE_INPUT_EXECUTION_MODE_CODE
+
+    if user_choice:
+        return RESOLVE_EXECUTION_MODE_CODE
+
+    return NO_INPUT_CODE
 
 
 TRIGGER_CHOICES = (
@@ -1329,6 +1532,12 @@ LAYOUT_CHOICES = ("Horizontal", "Vertical")
 
 PANEL_CHOICES = ("Embeddings", "Histograms")
 
+TRIGGER_GROUP = _make_radio_group(TRIGGER_CHOICES)
+
+LAYOUT_GROUP = _make_radio_group(LAYOUT_CHOICES)
+
+PANEL_GROUP = _make_radio_group(PANEL_CHOICES)
+
 
 def _operator_skeleton_execution_flow(ctx, inputs):
     inputs.bool(
@@ -1345,13 +1554,9 @@ def _operator_skeleton_execution_flow(ctx, inputs):
     has_trigger = ctx.params.get("operator_execution_has_trigger", False)
 
     if has_trigger:
-        trigger_group = types.RadioGroup()
-        for choice in TRIGGER_CHOICES:
-            trigger_group.add_choice(choice, label=choice)
-
         inputs.enum(
             "operator_execution_trigger",
-            trigger_group.values(),
+            TRIGGER_GROUP.values(),
             label="Trigger operator",
             description="You can trigger any operator! Here are some common choices",
             default=TRIGGER_CHOICES[0],
@@ -1363,112 +1568,122 @@ def _operator_skeleton_execution_flow(ctx, inputs):
         )
 
         if trigger_type == "Open A Panel":
-            panel_group = types.RadioGroup()
-            for choice in PANEL_CHOICES:
-                panel_group.add_choice(choice, label=choice)
-
             inputs.enum(
                 "operator_execution_trigger_panel",
-                panel_group.values(),
+                PANEL_GROUP.values(),
                 label="panel_type",
                 default=PANEL_CHOICES[0],
                 view=types.DropdownView(),
             )
 
-            layout_group = types.RadioGroup()
-            for choice in LAYOUT_CHOICES:
-                layout_group.add_choice(choice, label=choice)
-
             inputs.enum(
                 "operator_execution_trigger_layout",
-                layout_group.values(),
+                LAYOUT_GROUP.values(),
                 label="layout_type",
                 default=LAYOUT_CHOICES[0],
                 view=types.DropdownView(),
             )
 
 
-def _operator_skeleton_execution_code(ctx):
-    has_trigger = ctx.params.get("operator_execution_has_trigger", False)
+OPEN_PANEL_CODE_TEMPLATE = string.Template(
+    """
+def execute(self, ctx):
+    ### Your logic here ###
+
+    ctx.trigger(
+        "open_panel",
+        params=dict(
+            name="${panel_type}",
+            isActive=True,
+            layout="${layout_type}"
+            ),
+    )
+    return {}
+"""
+)
 
-    if has_trigger:
-        trigger_type = ctx.params.get(
-            "operator_execution_trigger", TRIGGER_CHOICES[0]
+
+RELOAD_SAMPLES_CODE = """
+def execute(self, ctx):
+    ### Your logic here ###
+
+    ctx.trigger("reload_samples")
+    return {}
+""".strip()
+
+RELOAD_DATASET_CODE = """
+def execute(self, ctx):
+    ### Your logic here ###
+
+    ctx.trigger("reload_dataset")
+    return {}
+""".strip()
+
+SET_VIEW_CODE = """
+def execute(self, ctx):
+    ### Your logic here ###
+
+    ### Create your view here ###
+    view = ctx.dataset.take(10)
+
+    ctx.trigger(
+        "set_view",
+        params=dict(view=_serialize_view(view)),
+    )
+    return {}
+""".strip()
+
+NO_TRIGGER_CODE = """
+def execute(self, ctx):
+    ### Your logic here ###
+
+    return {}
+""".strip()
+
+
+@functools.lru_cache(maxsize=32)
+def _operator_skeleton_execution_code(key):
+    params = _thaw_params(key)
+
+    has_trigger = params.get("operator_execution_has_trigger", False)
+
+    if not has_trigger:
+        return NO_TRIGGER_CODE
+
+    trigger_type = params.get("operator_execution_trigger", TRIGGER_CHOICES[0])
+    if trigger_type == "Reload Samples":
+        return RELOAD_SAMPLES_CODE
+
+    if trigger_type == "Reload Dataset":
+        return RELOAD_DATASET_CODE
+
+    if trigger_type == "Set View":
+        return SET_VIEW_CODE
+
+    if trigger_type == "Open A Panel":
+        panel_type = params.get(
+            "operator_execution_trigger_panel", PANEL_CHOICES[0]
         )
-        if trigger_type == "Reload Samples":
-            code = """
-            def execute(self, ctx):
-                ### Your logic here ###
-
-                ctx.trigger("reload_samples")
-                return {}
-            """
-        elif trigger_type == "Reload Dataset":
-            code = """
-            def execute(self, ctx):
-                ### Your logic here ###
-
-                ctx.trigger("reload_dataset")
-                return {}
-            """
-        elif trigger_type == "Set View":
-            code = """
-            def execute(self, ctx):
-                ### Your logic here ###
-            
-                ### Create your view here ###
-                view = ctx.dataset.take(10)
-
-                ctx.trigger(
-                    "set_view",
-                    params=dict(view=_serialize_view(view)),
-                )
-                return {}
-            """
-        elif trigger_type == "Open A Panel":
-            panel_type = ctx.params.get(
-                "operator_execution_trigger_panel", PANEL_CHOICES[0]
-            )
-            layout_type = ctx.params.get(
-                "operator_execution_trigger_layout", LAYOUT_CHOICES[0]
-            )
+        layout_type = params.get(
+            "operator_execution_trigger_layout", LAYOUT_CHOICES[0]
+        )
+        code = OPEN_PANEL_CODE_TEMPLATE.substitute(
+            panel_type=panel_type, layout_type=layout_type
+        )
+        return code.strip()
 
-            code = f"""
-            def execute(self, ctx):
-                ### Your logic here ###
-
-                ctx.trigger(
-                    "open_panel",
-                    params=dict(
-                        name="{panel_type}", 
-                        isActive=True, 
-                        layout="{layout_type}"
-                        ),
-                )
-                return {{}}
-            """
-        else:
-            raise ValueError("Invalid trigger type")
-    else:
-        code = """
-        def execute(self, ctx):
-            ### Your logic here ###
-        
-            return {}
-        """
+    raise ValueError("Invalid trigger type")
 
-    return _dedent_code(code)
 
+DELEGATION_CHOICES = ("False", "True", "User Choice")
+
+DELEGATION_GROUP = _make_radio_group(DELEGATION_CHOICES)
 
-def _operator_skeleton_delegation_flow(ctx, inputs):
-    delegation_choices = ("False", "True", "User Choice")
-    degelation_group = types.RadioGroup()
-    for choice in delegation_choices:
-        degelation_group.add_choice(choice, label=choice)
 
+def _operator_skeleton_delegation_flow(ctx, inputs):
     inputs.enum(
         "delegated_execution_choices",
-        degelation_group.values(),
+        DELEGATION_GROUP.values(),
         label="Delegate execution?",
         description=(
             "Should this operator be executed immediately or delegated for "
@@ -1479,11 +1694,16 @@ def _operator_skeleton_delegation_flow(ctx, inputs):
     )
 
 
+JSON_IMPORTS_CODE = """
+import json
+from bson import json_util
+""".strip()
+
 IMPORTS_CODE = """
 import fiftyone as fo
 import fiftyone.operators as foo
 from fiftyone.operators import types
-"""
+""".strip()
 
 EXECUTION_MODE_CODE = """
 def _execution_mode(ctx, inputs):
@@ -1515,48 +1735,48 @@ def _execution_mode(ctx, inputs):
                 )
             ),
         )
-"""
+""".strip()
 
 
-def _operator_skeleton_delegation_code(ctx):
-    delegated_execution = ctx.params.get(
-        "delegated_execution_choices", "False"
-    )
+DELEGATE_CODE = """
+def resolve_delegation(self, ctx):
+    True
+""".strip()
+
+USER_CHOICE_DELEGATE_CODE = """
+def resolve_delegation(self, ctx):
+    return ctx.params.get("delegate", False)
+""".strip()
 
+
+def _operator_skeleton_delegation_code(delegated_execution):
     if delegated_execution == "False":
-        code = ""
-    elif delegated_execution == "True":
-        code = """
-        def resolve_delegation(self, ctx):
-            True
-        """
-    elif delegated_execution == "User Choice":
-        code = """
-        def resolve_delegation(self, ctx):
-            return ctx.params.get("delegate", False)
-        """
-    else:
-        raise ValueError("Invalid delegation choice")
+        return ""
 
-    return _dedent_code(code)
+    if delegated_execution == "True":
+        return DELEGATE_CODE
 
+    if delegated_execution == "User Choice":
+        return USER_CHOICE_DELEGATE_CODE
 
-def _operator_skeleton_output_code(ctx):
-    has_output = ctx.params.get("operator_output_has_output", False)
+    raise ValueError("Invalid delegation choice")
 
-    if has_output:
-        code = """
-        def resolve_output(self, ctx):
-            outputs = types.Object()
 
-            ### Add your outputs here ###
+RESOLVE_OUTPUT_CODE = """
+def resolve_output(self, ctx):
+    outputs = types.Object()
 
-            return types.Property(outputs)
-        """
-    else:
-        code = ""
+    ### Add your outputs here ###
 
-    return _dedent_code(code)
+    return types.Property(outputs)
+""".strip()
+
+
+def _operator_skeleton_output_code(has_output):
+    if has_output:
+        return RESOLVE_OUTPUT_CODE
+
+    return ""
 
 
 PLACEMENTS = (
@@ -1565,18 +1785,20 @@ PLACEMENTS = (
     "SAMPLES-VIEWER-ACTIONS",
 )
 
+PLACEMENTS_GROUP = _make_radio_group(PLACEMENTS)
+
+
+PLACEMENT_HEADER = types.Header(
+    label="Placement",
+    description=(
+        "You can optionally place buttons, etc in the App to trigger "
+        "operators"
+    ),
+)
+
 
 def _operator_skeleton_placement_flow(ctx, inputs):
-    inputs.str(
-        "operator_skeleton_placement_header",
-        view=types.Header(
-            label="Placement",
-            description=(
-                "You can optionally place buttons, etc in the App to trigger "
-                "operators"
-            ),
-        ),
-    )
+    inputs.str("operator_skeleton_placement_header", view=PLACEMENT_HEADER)
 
     inputs.bool(
         "operator_placement_has_placement",
@@ -1586,13 +1808,9 @@ def _operator_skeleton_placement_flow(ctx, inputs):
     )
 
     if ctx.params.get("operator_placement_has_placement", False):
-        placement_group = types.RadioGroup()
-        for choice in PLACEMENTS:
-            placement_group.add_choice(choice, label=choice)
-
         inputs.enum(
             "operator_placement",
-            placement_group.values(),
+            PLACEMENTS_GROUP.values(),
             label="Placement",
             default=PLACEMENTS[0],
             view=types.DropdownView(),
@@ -1627,106 +1845,208 @@ def _operator_skeleton_placement_flow(ctx, inputs):
         )
 
 
-def _operator_skeleton_placement_code(ctx):
-    has_placement = ctx.params.get("operator_placement_has_placement", False)
+PLACEMENT_CODE_TEMPLATE = string.Template(
+    """
+def resolve_placement(self, ctx):
+    return types.Placement(
+        types.Places.${placement},
+        label="${placement_label}",
+        icon=${placement_icon},
+        prompt=${placement_prompt}
+    )
+"""
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _operator_skeleton_placement_code(key):
+    params = _thaw_params(key)
+
+    has_placement = params.get("operator_placement_has_placement", False)
 
     if has_placement:
-        placement = ctx.params.get("operator_placement", PLACEMENTS[0])
-        placement_label = ctx.params.get(
-            "placement_label", "My Placement Label"
-        )
-        placement_prompt = ctx.params.get("placement_prompt", False)
+        placement = params.get("operator_placement", PLACEMENTS[0])
+        placement_label = params.get("placement_label", "My Placement Label")
+        placement_prompt = params.get("placement_prompt", False)
 
-        placement_has_icon = ctx.params.get("placement_has_icon", True)
-        placement_icon = ctx.params.get("placement_icon", "/path/to/icon.svg")
+        placement_has_icon = params.get("placement_has_icon", True)
+        placement_icon = params.get("placement_icon", "/path/to/icon.svg")
         placement_icon = (
             f'"{placement_icon}"' if placement_has_icon else "None"
         )
 
-        code = f"""
-        def resolve_placement(self, ctx):
-            return types.Placement(
-                types.Places.{placement},
-                label="{placement_label}",
-                icon={placement_icon},
-                prompt={placement_prompt}
-            )
-        """
+        code = PLACEMENT_CODE_TEMPLATE.substitute(
+            placement=placement,
+            placement_label=placement_label,
+            placement_icon=placement_icon,
+            placement_prompt=placement_prompt,
+        )
     else:
         code = ""
 
-    return _dedent_code(code)
-
-
-def _dedent_code(code):
-    return dedent(code).strip()
+    return code.strip()
 
 
 def _indent_code(code):
-    dedented_code = _dedent_code(code)
-    return "    " + dedented_code.replace("\n", "\n    ")
+    return indent(code, "    ")
 
 
-def _create_operator_class_name(ctx):
-    operator_name = ctx.params.get("operator_name", "my_operator")
-    class_name = operator_name.replace("_", " ").title().replace(" ", "")
-    return class_name
+def _create_operator_class_name(params):
+    operator_name = params.get("operator_name", "my_operator")
+    words = operator_name.replace("_", " ").split()
+    return "".join(word.capitalize() for word in words)
 
 
 SERIALIZE_VIEW_CODE = """
 def _serialize_view(view):
     return json.loads(json_util.dumps(view._serialize()))
-"""
+""".strip()
 
 
-def _create_class_header(ctx):
-    class_name = _create_operator_class_name(ctx)
+def _create_class_header(class_name):
     return f"class {class_name}(foo.Operator):"
 
 
-def _create_footer(ctx):
-    class_name = _create_operator_class_name(ctx)
-    footer_code = f"""
-    def register(plugin):
-        plugin.register({class_name})
+FOOTER_CODE_TEMPLATE = string.Template(
     """
-    return _dedent_code(footer_code)
+def register(plugin):
+    plugin.register(${class_name})
+"""
+)
+
+
+def _create_footer(class_name):
+    return FOOTER_CODE_TEMPLATE.substitute(class_name=class_name).strip()
+
+
+# The ctx.params that determine each section of the skeleton code
+OPERATOR_CONFIG_PARAMS = (
+    "operator_name",
+    "operator_label",
+    "operator_description",
+    "config_bool_props",
+    "config_icon_props",
+)
+
+OPERATOR_EXECUTION_PARAMS = (
+    "operator_execution_has_trigger",
+    "operator_execution_trigger",
+    "operator_execution_trigger_panel",
+    "operator_execution_trigger_layout",
+)
+
+OPERATOR_PLACEMENT_PARAMS = (
+    "operator_placement_has_placement",
+    "operator_placement",
+    "placement_label",
+    "placement_has_icon",
+    "placement_icon",
+    "placement_prompt",
+)
+
+# The ctx.params that determine the generated skeleton code
+OPERATOR_SKELETON_PARAMS = (
+    OPERATOR_CONFIG_PARAMS
+    + ("operator_input_has_input", "operator_output_has_output")
+    + OPERATOR_EXECUTION_PARAMS
+    + ("delegated_execution_choices",)
+    + OPERATOR_PLACEMENT_PARAMS
+)
+
+
+def _freeze_params(params, names):
+    key = []
+    for name in names:
+        if name in params:
+            value = params[name]
+            if isinstance(value, dict):
+                value = tuple(sorted(value.items()))
+
+            key.append((name, value))
+
+    return tuple(key)
+
+
+def _thaw_params(key):
+    return {
+        name: dict(value) if isinstance(value, tuple) else value
+        for name, value in key
+    }
 
 
 def _create_operator_skeleton_code(ctx):
-    set_view = ctx.params.get("operator_execution_trigger", None) == "Set View"
-    user_choice = (
-        ctx.params.get("delegated_execution_choices", None) == "User Choice"
-    )
+    # resolve_input() runs on every form change, so the code is memoized on
+    # a hashable snapshot of the relevant params. Each section is also
+    # memoized on its own params, so editing one field only re-renders the
+    # section that depends on it
+    key = _freeze_params(ctx.params, OPERATOR_SKELETON_PARAMS)
+    return _build_operator_skeleton_code(key)
 
-    header = ""
 
-    if set_view:
-        header += "import json\n"
-        header += "from bson import json_util\n\n"
+def _create_operator_skeleton_code_parts(ctx):
+    key = _freeze_params(ctx.params, OPERATOR_SKELETON_PARAMS)
+    return _build_operator_skeleton_code_parts(key)
+
+
+@functools.lru_cache(maxsize=32)
+def _build_operator_skeleton_code(key):
+    return "".join(_build_operator_skeleton_code_parts(key))
+
 
-    header += IMPORTS_CODE.strip() + "\n\n\n"
-    header += _create_class_header(ctx) + "\n"
+@functools.lru_cache(maxsize=32)
+def _build_operator_skeleton_code_parts(key):
+    params = _thaw_params(key)
+
+    has_input = params.get("operator_input_has_input", False)
+    has_output = params.get("operator_output_has_output", False)
+    delegation = params.get("delegated_execution_choices", "False")
+    user_choice = delegation == "User Choice"
+    set_view = params.get("operator_execution_trigger", None) == "Set View"
+
+    imports = IMPORTS_CODE
+    if set_view:
+        imports = JSON_IMPORTS_CODE + "\n\n" + imports
 
     chunks = [
-        _create_operator_config_code(ctx),
-        _operator_skeleton_input_code(ctx),
-        _operator_skeleton_placement_code(ctx),
-        _operator_skeleton_delegation_code(ctx),
-        _operator_skeleton_execution_code(ctx),
-        _operator_skeleton_output_code(ctx),
+        _create_operator_config_code(
+            _freeze_params(params, OPERATOR_CONFIG_PARAMS)
+        ),
+        _operator_skeleton_input_code(has_input, user_choice),
+        _operator_skeleton_placement_code(
+            _freeze_params(params, OPERATOR_PLACEMENT_PARAMS)
+        ),
+        _operator_skeleton_delegation_code(delegation),
+        _operator_skeleton_execution_code(
+            _freeze_params(params, OPERATOR_EXECUTION_PARAMS)
+        ),
+        _operator_skeleton_output_code(has_output),
     ]
-    body = _indent_code("\n\n".join([c for c in chunks if c])) + "\n\n\n"
+    body = _indent_code("\n\n".join([c for c in chunks if c]))
+
+    class_name = _create_operator_class_name(params)
+
+    parts = [imports, _create_class_header(class_name) + "\n" + body]
 
     if user_choice:
-        body += EXECUTION_MODE_CODE.strip() + "\n\n\n"
+        parts.append(EXECUTION_MODE_CODE)
 
     if set_view:
-        body += SERIALIZE_VIEW_CODE.strip() + "\n\n\n"
+        parts.append(SERIALIZE_VIEW_CODE)
+
+    parts.append(_create_footer(class_name))
 
-    footer = _create_footer(ctx) + "\n"
+    # Interleave the blank-line separators so that the parts can be written
+    # out directly
+    code_parts = []
+    for part in parts:
+        if code_parts:
+            code_parts.append("\n\n\n")
 
-    return header + body + footer
+        code_parts.append(part)
+
+    code_parts.append("\n")
+
+    return tuple(code_parts)
 
 
 def _operator_skeleton_view_code_flow(ctx, inputs):
@@ -1739,6 +2059,11 @@ def _operator_skeleton_view_code_flow(ctx, inputs):
     )
 
 
+LOCATION_TABS = types.TabsView()
+LOCATION_TABS.add_choice("PLUGIN", label="Plugins directory")
+LOCATION_TABS.add_choice("OTHER", label="Other directory")
+
+
 def _create_skeleton(ctx, inputs):
     inputs.str(
         "plugin_name",
@@ -1763,14 +2088,11 @@ def _create_skeleton(ctx, inputs):
         ),
     )
 
-    tab_choices = types.TabsView()
-    tab_choices.add_choice("PLUGIN", label="Plugins directory")
-    tab_choices.add_choice("OTHER", label="Other directory")
     inputs.enum(
         "location",
-        tab_choices.values(),
+        LOCATION_TABS.values(),
         default="PLUGIN",
-        view=tab_choices,
+        view=LOCATION_TABS,
     )
     tab = ctx.params.get("location", "PLUGIN")
 
@@ -1823,20 +2145,29 @@ def _parse_plugin_dir(ctx):
     return plugin_dir
 
 
+FIFTYONE_YML_CODE_TEMPLATE = string.Template(
+    """
+name: "${plugin_name}"
+version: "0.1.0"
+description: "${plugin_description}"
+operators:
+  - ${operator_name}
+"""
+)
+
+
 def _create_fiftyone_yml_code(ctx):
     plugin_name = ctx.params["plugin_name"]
     plugin_description = ctx.params.get(
         "plugin_description", "My plugin description"
     )
     operator_name = ctx.params.get("operator_name", "my_operator")
-    yml_code = f"""
-    name: "{plugin_name}"
-    version: "0.1.0"
-    description: "{plugin_description}"
-    operators:
-      - {operator_name}
-    """
-    return _dedent_code(yml_code) + "\n"
+    yml_code = FIFTYONE_YML_CODE_TEMPLATE.substitute(
+        plugin_name=plugin_name,
+        plugin_description=plugin_description,
+        operator_name=operator_name,
+    )
+    return yml_code.strip() + "\n"
 
 
 def register(p):
@@ -6,18 +6,171 @@ Plugin management utilities.
 |
 """
 import functools
+import json
+import os
+import re
+import tempfile
+import threading
+import time
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import yaml
+
+import fiftyone as fo
+import fiftyone.constants as foc
+import fiftyone.plugins as fop
 import fiftyone.plugins.utils as fopu
+from fiftyone.utils.github import GitHubRepository
+
+
+# Zoo listings and plugin metadata are cached on disk so that re-rendering
+# the install form doesn't re-hit GitHub
+_CACHE_PATH = os.path.join(foc.FIFTYONE_CONFIG_DIR, "plugin_zoo_cache.json")
+_DEFAULT_CACHE_TTL = 3600
+
+_cache = None
+_cache_dirty = False
+_cache_lock = threading.Lock()
+_cache_write_lock = threading.Lock()
+
+# Plugin searches are re-run at most this often (in seconds) per location
+_FIND_PLUGINS_TTL = 300
+_FIND_PLUGINS_MAX_SIZE = 64
+
+_find_plugins_cache = {}
+_find_plugins_lock = threading.Lock()
+
+# The in-memory zoo listing is re-checked against the cache this often (in
+# seconds), so that it expires along with its cache entry
+_ZOO_TTL = 60
+
+_GH_URL_RE = re.compile(
+    r"^(?:https?://github\.com/)?(?P<user>[^/]+)/(?P<repo>[^/]+?)"
+    r"(?:/(?:tree|commit)/(?P<ref>[^/]+))?/?$",
+    re.IGNORECASE,
+)
+
+_GRAPHQL_URL = "https://api.github.com/graphql"
+_GRAPHQL_BATCH_SIZE = 100
+_GRAPHQL_TIMEOUT = 30
+
+# Connections to GitHub are pooled and transient failures are retried. Rate
+# limits are handled by _request() rather than by sleeping on Retry-After
+_SESSION = requests.Session()
+_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=("GET", "POST"),
+            respect_retry_after_header=False,
+        ),
+    ),
+)
+
+# Rate limited requests are retried with exponential backoff, unless GitHub
+# asks us to wait longer than is reasonable for an interactive form
+_RATE_LIMIT_RETRIES = 3
+_RATE_LIMIT_MAX_DELAY = 10
+
+# How long (in seconds) to stop fetching after a rate limited plugin fetch
+# that doesn't say when the limit resets
+_RATE_LIMIT_COOLDOWN = 60
+
+_rate_limit_reset = None
+_rate_limit_lock = threading.Lock()
+
+
+def _parse_cache_ttl():
+    ttl = os.environ.get("FIFTYONE_PLUGIN_ZOO_CACHE_TTL", None)
+    if ttl is None:
+        return _DEFAULT_CACHE_TTL
+
+    try:
+        return float(ttl)
+    except ValueError:
+        return _DEFAULT_CACHE_TTL
+
+
+_CACHE_TTL = _parse_cache_ttl()
+
+
+class RateLimitError(Exception):
+    """Exception raised when the GitHub API rate limit has been exceeded."""
+
+    pass
 
 
-@functools.lru_cache
 def find_plugins(gh_repo):
-    return fopu.find_plugins(gh_repo, info=True)
+    # Equivalent locations share a cache entry, but the search itself is run
+    # on the location as given, since that's what will be installed
+    key = _normalize_gh_repo(gh_repo)
+    ttl_hash = _ttl_hash(_FIND_PLUGINS_TTL)
+
+    with _find_plugins_lock:
+        entry = _find_plugins_cache.get(key, None)
+
+    if entry is not None and entry[0] == ttl_hash:
+        return list(entry[1])
+
+    plugins = tuple(fopu.find_plugins(gh_repo, info=True))
+
+    with _find_plugins_lock:
+        _find_plugins_cache.pop(key, None)
+        _find_plugins_cache[key] = (ttl_hash, plugins)
+        while len(_find_plugins_cache) > _FIND_PLUGINS_MAX_SIZE:
+            del _find_plugins_cache[next(iter(_find_plugins_cache))]
+
+    return list(plugins)
+
+
+def _ttl_hash(ttl):
+    return int(time.time() // ttl)
+
+
+def _normalize_gh_repo(gh_repo):
+    gh_repo = gh_repo.strip()
+
+    # Common locations are converted to `<user>/<repo>[/<ref>]` strings so
+    # that equivalent URLs share a cache entry
+    m = _GH_URL_RE.match(gh_repo)
+    if m is not None:
+        gh_repo = m.group("user") + "/" + m.group("repo")
+        if m.group("ref"):
+            gh_repo += "/" + m.group("ref")
+
+        return gh_repo
+
+    gh_repo = gh_repo.rstrip("/")
+
+    # Hostnames are case-insensitive, but GitHub paths may not be
+    scheme, sep, rest = gh_repo.partition("://")
+    if sep:
+        host, slash, path = rest.partition("/")
+        gh_repo = scheme.lower() + sep + host.lower() + slash + path
+
+    return gh_repo
 
 
-@functools.lru_cache
 def get_zoo_plugins():
-    plugins = fopu.list_zoo_plugins()
+    voxel51_plugins, community_plugins, _ = _zoo(_ttl_hash(_ZOO_TTL))
+    return voxel51_plugins, community_plugins
+
+
+def get_zoo_plugin_url(name):
+    return _zoo(_ttl_hash(_ZOO_TTL))[2].get(name, None)
+
+
+@functools.lru_cache(maxsize=1)
+def _zoo(ttl_hash):
+    plugins = _cached("zoo", fopu.list_zoo_plugins)
+    flush_cache()
 
     voxel51_plugins = []
     community_plugins = []
@@ -27,9 +180,453 @@ def get_zoo_plugins():
         else:
             community_plugins.append(plugin)
 
-    return voxel51_plugins, community_plugins
+    urls = {plugin["name"]: plugin["url"] for plugin in plugins}
+
+    return voxel51_plugins, community_plugins, urls
 
 
-@functools.lru_cache
 def get_plugin_info(gh_repo, path=None):
-    return fopu.get_plugin_info(gh_repo, path=path)
+    key = gh_repo if path is None else gh_repo + "::" + path
+    return _cached(key, _get_plugin_info, gh_repo, path=path)
+
+
+def _get_plugin_info(gh_repo, path=None):
+    # These requests are made by fiftyone, so rate limits are detected from
+    # the errors they raise, and later fetches fail fast until the reset
+    _check_rate_limit()
+
+    try:
+        return fopu.get_plugin_info(gh_repo, path=path)
+    except requests.HTTPError as e:
+        if e.response is None or not _is_rate_limited(e.response):
+            raise
+
+        reset = _get_rate_limit_reset(e.response)
+        if reset is None:
+            reset = time.time() + _RATE_LIMIT_COOLDOWN
+
+        _set_rate_limit_reset(reset)
+
+        raise RateLimitError("GitHub API rate limit exceeded") from e
+
+
+def get_plugin_infos(gh_repos):
+    """Retrieves the plugin info for multiple GitHub locations, batching the
+    requests via the GitHub GraphQL API.
+
+    The GraphQL API requires authentication, so plugin info is only fetched
+    when a ``GITHUB_TOKEN`` environment variable is available. Otherwise, or
+    if the query fails, only previously cached info is returned and callers
+    should fall back to :func:`get_plugin_info` for the remaining locations.
+
+    Args:
+        gh_repos: an iterable of GitHub locations
+
+    Returns:
+        a dict mapping locations to plugin info dicts
+    """
+    infos = {}
+    missing = []
+    for gh_repo in gh_repos:
+        info = _lookup(gh_repo)
+        if info is not None:
+            infos[gh_repo] = info
+        else:
+            missing.append(gh_repo)
+
+    token = os.environ.get("GITHUB_TOKEN", None)
+    if not token or not missing:
+        return infos
+
+    for i in range(0, len(missing), _GRAPHQL_BATCH_SIZE):
+        batch = missing[i : i + _GRAPHQL_BATCH_SIZE]
+        try:
+            yml_texts = _query_plugin_ymls(batch, token)
+        except (requests.RequestException, RateLimitError):
+            continue
+
+        for gh_repo, yml_text in yml_texts.items():
+            try:
+                info = yaml.safe_load(yml_text)
+            except yaml.YAMLError:
+                continue
+
+            if isinstance(info, dict):
+                _store(gh_repo, info)
+                infos[gh_repo] = info
+
+    flush_cache()
+
+    return infos
+
+
+def is_rate_limit_error(e):
+    """Determines whether the given exception was caused by exceeding the
+    GitHub API rate limit.
+
+    Args:
+        e: an exception
+
+    Returns:
+        True/False
+    """
+    if isinstance(e, RateLimitError):
+        return True
+
+    if isinstance(e, requests.HTTPError) and e.response is not None:
+        return _is_rate_limited(e.response)
+
+    return False
+
+
+def clear_cache():
+    """Clears the cached plugin searches, zoo listings, and plugin
+    metadata.
+    """
+    global _cache, _cache_dirty
+
+    with _find_plugins_lock:
+        _find_plugins_cache.clear()
+
+    _zoo.cache_clear()
+
+    with _cache_lock:
+        _cache = {}
+        _cache_dirty = False
+        try:
+            os.remove(_CACHE_PATH)
+        except OSError:
+            pass
+
+
+def flush_cache():
+    """Writes any plugin metadata that has been fetched since the last flush
+    to the on-disk cache.
+
+    Metadata is only cached in memory as it is fetched, so call this once
+    after a batch of :func:`get_plugin_info` calls.
+    """
+    global _cache_dirty
+
+    with _cache_write_lock:
+        with _cache_lock:
+            if not _cache_dirty:
+                return
+
+            cache = dict(_load_cache())
+            _cache_dirty = False
+
+        _write_cache(cache)
+
+
+def list_plugins():
+    """Returns the definitions of all installed plugins, both enabled and
+    disabled.
+
+    The result is cached until the plugins directory is modified or
+    :func:`clear_plugins_cache` is called.
+
+    Returns:
+        a list of :class:`fiftyone.plugins.PluginDefinition` instances
+    """
+    return _list_plugins(_plugins_dir_fingerprint())
+
+
+def list_enabled_plugins():
+    """Returns the names of the enabled plugins.
+
+    Enablement is stored in the App config, which may be edited by other
+    processes, so this is always read fresh.
+
+    Returns:
+        a frozenset of plugin names
+    """
+    return frozenset(fop.list_enabled_plugins())
+
+
+def list_plugin_names():
+    """Returns the sorted names of all installed plugins, both enabled and
+    disabled.
+
+    The result is cached until the plugins directory is modified or
+    :func:`clear_plugins_cache` is called.
+
+    Returns:
+        a tuple of plugin names
+    """
+    return _list_plugin_names(_plugins_dir_fingerprint())
+
+
+def list_plugin_summaries():
+    """Returns ``(name, url, description)`` tuples describing all installed
+    plugins, both enabled and disabled.
+
+    The result is cached until the plugins directory is modified or
+    :func:`clear_plugins_cache` is called.
+
+    Returns:
+        a tuple of ``(name, url, description)`` tuples
+    """
+    return _list_plugin_summaries(_plugins_dir_fingerprint())
+
+
+def clear_plugins_cache():
+    """Clears the cached installed plugin listings. Call this whenever
+    plugins are installed or removed.
+    """
+    _list_plugins.cache_clear()
+    _list_plugin_names.cache_clear()
+    _list_plugin_summaries.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _list_plugins(fingerprint):
+    return fop.list_plugins(enabled="all")
+
+
+@functools.lru_cache(maxsize=1)
+def _list_plugin_names(fingerprint):
+    return tuple(sorted(p.name for p in _list_plugins(fingerprint)))
+
+
+@functools.lru_cache(maxsize=1)
+def _list_plugin_summaries(fingerprint):
+    return tuple(
+        (p.name, p.url, p.description) for p in _list_plugins(fingerprint)
+    )
+
+
+def _plugins_dir_fingerprint():
+    plugins_dir = fo.config.plugins_dir
+    if not plugins_dir:
+        return None
+
+    try:
+        stat = os.stat(plugins_dir)
+    except OSError:
+        return None
+
+    # Plugins live in `<name>` or `@<org>/<name>` subdirectories, so their
+    # directories and metadata files are included in order to detect plugins
+    # that are updated in place
+    fingerprint = [(plugins_dir, stat.st_mtime_ns)]
+    _fingerprint_dir(plugins_dir, 3, fingerprint)
+
+    return tuple(fingerprint)
+
+
+def _fingerprint_dir(dirpath, depth, fingerprint):
+    try:
+        with os.scandir(dirpath) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return
+
+    for entry in entries:
+        try:
+            if entry.is_dir():
+                fingerprint.append((entry.path, entry.stat().st_mtime_ns))
+                if depth > 1:
+                    _fingerprint_dir(entry.path, depth - 1, fingerprint)
+            elif entry.name in ("fiftyone.yml", "fiftyone.yaml"):
+                fingerprint.append((entry.path, entry.stat().st_mtime_ns))
+        except OSError:
+            pass
+
+
+def _query_plugin_ymls(gh_repos, token):
+    text = "{ ... on Blob { text } }"
+    fields = []
+    for i, gh_repo in enumerate(gh_repos):
+        # Locations that can't be parsed are left for get_plugin_info()
+        try:
+            repo = GitHubRepository(gh_repo)
+            path = _get_repo_path(gh_repo)
+        except ValueError:
+            continue
+
+        prefix = (repo.ref or "HEAD") + ":"
+        if path:
+            prefix += path.strip("/") + "/"
+
+        owner = json.dumps(repo.user)
+        name = json.dumps(repo.repo)
+        yml_path = json.dumps(prefix + "fiftyone.yml")
+        yaml_path = json.dumps(prefix + "fiftyone.yaml")
+        fields.append(
+            f"r{i}: repository(owner: {owner}, name: {name}) {{ "
+            f"yml: object(expression: {yml_path}) {text} "
+            f"yaml: object(expression: {yaml_path}) {text} "
+            "}"
+        )
+
+    response = _request(
+        "POST",
+        _GRAPHQL_URL,
+        json={"query": "query { " + " ".join(fields) + " }"},
+        headers={"Authorization": "bearer " + token},
+        timeout=_GRAPHQL_TIMEOUT,
+    )
+    response.raise_for_status()
+
+    # Repos that can't be resolved are null, with details in "errors"
+    data = response.json().get("data", None) or {}
+
+    yml_texts = {}
+    for i, gh_repo in enumerate(gh_repos):
+        node = data.get(f"r{i}", None) or {}
+        blob = node.get("yml", None) or node.get("yaml", None)
+        if blob and blob.get("text", None) is not None:
+            yml_texts[gh_repo] = blob["text"]
+
+    return yml_texts
+
+
+def _get_repo_path(gh_repo):
+    # Only URLs can contain a path within the repository; identifiers are of
+    # the form `<user>/<repo>[/<ref>]`
+    if "github.com" not in gh_repo.lower():
+        return None
+
+    return GitHubRepository.parse_url(gh_repo).get("path", None)
+
+
+def _request(method, url, **kwargs):
+    for attempt in range(_RATE_LIMIT_RETRIES + 1):
+        _check_rate_limit()
+
+        response = _SESSION.request(method, url, **kwargs)
+
+        if response.headers.get("X-RateLimit-Remaining", None) == "0":
+            _set_rate_limit_reset(_get_rate_limit_reset(response))
+        else:
+            _set_rate_limit_reset(None)
+
+        if not _is_rate_limited(response):
+            return response
+
+        delay = _get_retry_delay(response, attempt)
+        if attempt == _RATE_LIMIT_RETRIES or delay > _RATE_LIMIT_MAX_DELAY:
+            raise RateLimitError("GitHub API rate limit exceeded")
+
+        time.sleep(delay)
+
+
+def _check_rate_limit():
+    with _rate_limit_lock:
+        reset = _rate_limit_reset
+
+    # Don't spend requests while the rate limit is known to be exhausted
+    if reset is not None and reset - time.time() > _RATE_LIMIT_MAX_DELAY:
+        raise RateLimitError("GitHub API rate limit exceeded")
+
+
+def _set_rate_limit_reset(reset):
+    global _rate_limit_reset
+
+    with _rate_limit_lock:
+        _rate_limit_reset = reset
+
+
+def _is_rate_limited(response):
+    if response.status_code == 429:
+        return True
+
+    if response.status_code == 403:
+        headers = response.headers
+        return (
+            headers.get("X-RateLimit-Remaining", None) == "0"
+            or "Retry-After" in headers
+        )
+
+    return False
+
+
+def _get_rate_limit_reset(response):
+    try:
+        return float(response.headers["X-RateLimit-Reset"])
+    except (KeyError, ValueError):
+        return None
+
+
+def _get_retry_delay(response, attempt):
+    try:
+        return float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        pass
+
+    reset = _get_rate_limit_reset(response)
+    if reset is not None:
+        return max(reset - time.time(), 0)
+
+    return 0.5 * 2**attempt
+
+
+def _cached(key, fcn, *args, **kwargs):
+    body = _lookup(key)
+    if body is not None:
+        return body
+
+    body = fcn(*args, **kwargs)
+    _store(key, body)
+
+    return body
+
+
+def _lookup(key):
+    with _cache_lock:
+        entry = _load_cache().get(key, None)
+
+    # Malformed entries are treated as misses
+    try:
+        if time.time() - entry["fetched_at"] < _CACHE_TTL:
+            return entry["body"]
+    except (KeyError, TypeError):
+        pass
+
+    return None
+
+
+def _store(key, body):
+    global _cache_dirty
+
+    with _cache_lock:
+        _load_cache()[key] = {"body": body, "fetched_at": time.time()}
+        _cache_dirty = True
+
+
+def _load_cache():
+    global _cache
+
+    if _cache is None:
+        try:
+            with open(_CACHE_PATH, "r") as f:
+                _cache = json.load(f)
+        except (OSError, ValueError):
+            _cache = None
+
+        if not isinstance(_cache, dict):
+            _cache = {}
+
+    return _cache
+
+
+def _write_cache(cache):
+    # The cache is best-effort, so failures to persist it are not fatal. Each
+    # write goes through its own temporary file so that processes sharing the
+    # cache can't replace it with each other's partial writes
+    tmp_path = None
+    try:
+        cache_dir = os.path.dirname(_CACHE_PATH)
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(cache, f)
+
+        os.replace(tmp_path, _CACHE_PATH)
+    except (OSError, TypeError, ValueError):
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass